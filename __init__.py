@@ -3,10 +3,6 @@ This module initializes the geodata package.
 """
 
 import logging
-import sys
-
-import numpy as np
-import pandas as pd
 
 from geodata import GeoData, GeoLevel, Quality
 
@@ -14,16 +10,6 @@ from geodata import GeoData, GeoLevel, Quality
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Check for required dependencies
-REQUIRED_PACKAGES = ["numpy", "pandas", "geopandas"]
-
-for package in REQUIRED_PACKAGES:
-    try:
-        __import__(package)
-    except ImportError:
-        logger.error("Required package '%s' is not installed.", package)
-        sys.exit(1)
-
 __all__ = ["GeoData", "GeoLevel", "Quality"]
 
 __doc__ = """
@@ -55,23 +41,3 @@ Examples
 >>> geodata.metadata
 >>> geodata.plot()
 """
-
-
-# Validate package versions (optional)
-def validate_package_versions():
-    """
-    Validate the versions of the required packages.
-    """
-    if np.__version__ < "1.18.0":
-        logger.warning(
-            "Numpy version is lower than 1.18.0. "
-            "Some features may not work as expected."
-        )
-    if pd.__version__ < "1.0.0":
-        logger.warning(
-            "Pandas version is lower than 1.0.0. "
-            "Some features may not work as expected."
-        )
-
-
-validate_package_versions()
@@ -2,15 +2,282 @@
 This module provides the GeoDataBase class for handling geospatial data.
 """
 
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import cached_property, lru_cache
+
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson as json
+except ImportError:  # pragma: no cover - optional dependency
+    import json
 
+from geodata.core.cache import read_cached, write_cached
 from geodata.core.geolevel import GeoLevel
 from geodata.core.quality import Quality
 
 URL_SPATIAL: str = "https://servicodados.ibge.gov.br/api/v4/malhas"
 URL_METADATA: str = "https://servicodados.ibge.gov.br/api/v1/localidades"
+TIMEOUT: tuple[float, float] = (5, 30)
+
+# Shared HTTP session: keeps connections to the IBGE API alive across calls
+# and instances instead of renegotiating TCP + TLS on every request.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            # Hand the last error response back so raise_for_status() raises
+            # requests.HTTPError, instead of urllib3 raising a RetryError.
+            raise_on_status=False,
+        ),
+    ),
+)
+_SESSION.headers.update({"User-Agent": "ibge-geodata", "Accept-Encoding": "gzip"})
+
+# Layers shared in memory by all GeoDataBase instances (see _remember), most
+# recently used last. 32 entries fit every level at every quality plus metadata.
+_MEMORY_SIZE: int = 32
+_MEMORY: OrderedDict[tuple[str, ...], pd.DataFrame] = OrderedDict()
+_MEMORY_LOCK = threading.Lock()
+
+
+def _parse_features(content: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parse a GeoJSON FeatureCollection into area codes and geometries.
+
+    The document is decoded with (or)json and the geometries are built straight
+    from the decoded features by :meth:`gpd.GeoDataFrame.from_features`, rather
+    than serialising each geometry again for :func:`shapely.from_geojson`.
+
+    Parameters
+    ----------
+    content : bytes
+        The raw GeoJSON document returned by the IBGE API.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The ``codarea`` property and the geometry of each feature.
+    """
+    frame = gpd.GeoDataFrame.from_features(json.loads(content)["features"])
+    return frame["codarea"].to_numpy(), frame.geometry.to_numpy()
+
+
+def _download_polygons(
+    spatial: str, quality: str, session: requests.Session
+) -> gpd.GeoDataFrame:
+    """
+    Download the polygons of a spatial level from the IBGE API.
+
+    Parameters
+    ----------
+    spatial : str
+        The spatial level value (e.g., ``'municipio'``).
+    quality : str
+        The quality value (e.g., ``'minima'``).
+    session : requests.Session
+        The HTTP session used for the request.
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        The polygons of the spatial data.
+    """
+    url = f"{URL_SPATIAL}/paises/BR"
+    params = {
+        "intrarregiao": spatial,
+        "qualidade": quality,
+        "formato": "application/vnd.geo+json",
+    }
+    if spatial == "paises":
+        params.pop("intrarregiao")
+    response = session.get(url, params=params, timeout=TIMEOUT)
+    response.raise_for_status()
+    codes, geometry = _parse_features(response.content)
+    if spatial == "paises":
+        # Single feature whose area code ("BR") is not numeric.
+        return gpd.GeoDataFrame(
+            {"id": np.ones(len(codes), dtype=np.int32)},
+            geometry=geometry,
+            crs="EPSG:4674",
+        )
+    return gpd.GeoDataFrame(
+        {"id": codes.astype(np.int32)}, geometry=geometry, crs="EPSG:4674"
+    )
+
+
+def _remember(key: tuple[str, ...], load: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+    """
+    Return the in-memory layer stored under ``key``, loading it on a miss.
+
+    The cache is keyed on the layer only, never on the HTTP session used to
+    download it, so layers are shared by every ``GeoDataBase`` and no
+    caller-provided session is kept alive by the cache. The least recently used
+    entry is dropped beyond :data:`_MEMORY_SIZE` layers.
+
+    Parameters
+    ----------
+    key : tuple[str, ...]
+        Identifies the layer (kind and API values).
+    load : Callable[[], pd.DataFrame]
+        Loads the layer on a miss.
+
+    Returns
+    -------
+    pd.DataFrame
+        The cached layer. Callers must not modify it.
+    """
+    with _MEMORY_LOCK:
+        if key in _MEMORY:
+            _MEMORY.move_to_end(key)
+            return _MEMORY[key]
+    data = load()
+    with _MEMORY_LOCK:
+        _MEMORY[key] = data
+        _MEMORY.move_to_end(key)
+        while len(_MEMORY) > _MEMORY_SIZE:
+            _MEMORY.popitem(last=False)
+    return data
+
+
+def _fetch_polygons(
+    spatial: str, quality: str, session: requests.Session
+) -> gpd.GeoDataFrame:
+    """
+    Get the polygons of a spatial level, from the on-disk cache if available.
+
+    Results are also kept in memory, so every ``GeoDataBase`` of the same level and
+    quality in the process shares one download. Callers must not modify the
+    returned frame.
+
+    Parameters
+    ----------
+    spatial : str
+        The spatial level value (e.g., ``'municipio'``).
+    quality : str
+        The quality value (e.g., ``'minima'``).
+    session : requests.Session
+        The HTTP session used on a cache miss (not part of the cache key).
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        The polygons of the spatial data.
+    """
+
+    def load() -> gpd.GeoDataFrame:
+        name = f"{spatial}_{quality}"
+        data = read_cached(name, geo=True)
+        if data is None:
+            data = _download_polygons(spatial, quality, session)
+            write_cached(name, data)
+        return data
+
+    return _remember(("polygons", spatial, quality), load)
+
+
+def _download_metadata(metadata: str, session: requests.Session) -> pd.DataFrame:
+    """
+    Download the metadata of a spatial level from the IBGE API.
+
+    Parameters
+    ----------
+    metadata : str
+        The metadata level value (e.g., ``'municipios'``).
+    session : requests.Session
+        The HTTP session used for the request.
+
+    Returns
+    -------
+    pd.DataFrame
+        The metadata of the spatial data.
+    """
+    url = f"{URL_METADATA}/{metadata}"
+    params = {"view": "nivelado"}
+    response = session.get(url, params=params, timeout=TIMEOUT)
+    response.raise_for_status()
+    data = json.loads(response.content)
+    return pd.DataFrame.from_dict(data)
+
+
+def _fetch_metadata(metadata: str, session: requests.Session) -> pd.DataFrame:
+    """
+    Get the metadata of a spatial level, from the on-disk cache if available.
+
+    Results are also kept in memory and shared by every ``GeoDataBase`` of the same
+    level in the process. Callers must not modify the returned frame.
+
+    Parameters
+    ----------
+    metadata : str
+        The metadata level value (e.g., ``'municipios'``).
+    session : requests.Session
+        The HTTP session used on a cache miss (not part of the cache key).
+
+    Returns
+    -------
+    pd.DataFrame
+        The metadata of the spatial data.
+    """
+
+    def load() -> pd.DataFrame:
+        name = f"{metadata}_metadata"
+        data = read_cached(name)
+        if data is None:
+            data = _download_metadata(metadata, session)
+            write_cached(name, data)
+        return data
+
+    return _remember(("metadata", metadata), load)
+
+
+@lru_cache(maxsize=None)
+def _metadata_rename_spec(
+    spatial: str, columns: tuple[str, ...]
+) -> tuple[list[str], dict[str, str]]:
+    """
+    Compute the columns to drop and rename when cleaning the IBGE metadata.
+
+    The result depends only on the spatial level and the column names returned by
+    the API, so it is computed once per combination and reused. The labels are
+    classified with vectorised ``pd.Index.str`` operations rather than Python
+    string loops.
+
+    Parameters
+    ----------
+    spatial : str
+        The spatial level value (e.g., ``'municipio'``).
+    columns : tuple[str, ...]
+        The column names of the raw metadata.
+
+    Returns
+    -------
+    tuple[list[str], dict[str, str]]
+        The columns to drop and the mapping used to rename the remaining ones.
+    """
+    labels = pd.Index(columns, dtype=str)
+    own = labels.str.startswith(spatial)
+    dropped = labels.str.endswith("id") & ~own
+    kept = labels[~dropped]
+    renamed = np.where(
+        own[~dropped],
+        kept.str.split("-").str[-1],
+        kept.str.replace("-nome", "", regex=False),
+    )
+    return labels[dropped].tolist(), dict(zip(kept.tolist(), renamed.tolist()))
 
 
 class GeoDataBase:
@@ -23,19 +290,37 @@ class GeoDataBase:
         The geographical level of the spatial data.
     quality : Quality
         The quality level of the spatial data.
+    session : requests.Session | None, optional
+        The HTTP session used for the IBGE API requests (default: a session shared
+        by all instances, which keeps connections alive between calls).
 
     Properties
     ----------
     metadata : pd.DataFrame
-        The metadata of the spatial data.
+        The metadata of the spatial data (computed once per instance; the download
+        is shared by all instances of the same level).
     polygons : gpd.GeoDataFrame
-        The polygons of the spatial data.
+        The polygons of the spatial data (computed once per instance; the download
+        is shared by all instances of the same level and quality).
+    polygons_only : gpd.GeoDataFrame
+        The ``id`` and ``geometry`` of the polygons, without metadata (computed
+        once per instance).
 
     """
 
-    def __init__(self, geolevel: GeoLevel, quality: Quality):
+    def __init__(
+        self,
+        geolevel: GeoLevel,
+        quality: Quality,
+        session: requests.Session | None = None,
+    ):
         self.geolevel = geolevel
         self.quality = quality
+        self._session = session if session is not None else _SESSION
+        # Raw API values, resolved once instead of through the enums on every use.
+        self._spatial_val: str = geolevel.spatial.value
+        self._metadata_val: str = geolevel.metadata.value
+        self._quality_val: str = quality.value
 
     def __repr__(self):
         """Return a string representation of the GeoData instance."""
@@ -45,40 +330,19 @@ class GeoDataBase:
         """Return a string representation of the GeoData instance."""
         return f"GeoData: {self.geolevel.spatial} - {self.quality.value}"
 
-    def _fetch_polygons(self) -> gpd.GeoDataFrame:
+    @staticmethod
+    def clear_cache() -> None:
         """
-        Get the polygons of the spatial data.
+        Drop the layers kept in memory and shared between instances.
 
-        Returns
-        -------
-        gpd.GeoDataFrame
-            The polygons of the spatial data.
+        The on-disk cache is left untouched; existing instances keep the data they
+        have already loaded.
         """
-        url = f"{URL_SPATIAL}/paises/BR"
-        params = {
-            "intrarregiao": self.geolevel.spatial.value,
-            "qualidade": self.quality.value,
-            "formato": "application/vnd.geo+json",
-        }
-        if self.geolevel.spatial == "paises":
-            params.pop("intrarregiao")
-        with requests.Session() as session:
-            response = session.get(url, params=params)
-            response.raise_for_status()
-            data = (
-                gpd.GeoDataFrame.from_features(response.json())
-                .set_axis(["geometry", "id"], axis=1)
-                .reindex(columns=["id", "geometry"])
-                .assign(
-                    id=lambda df: (
-                        1 if self.geolevel.spatial.value == "paises" else df.id
-                    )
-                )
-                .astype({"id": int})
-            )
-        return data
+        with _MEMORY_LOCK:
+            _MEMORY.clear()
 
-    def _fetch_metadata(self) -> pd.DataFrame:
+    @cached_property
+    def metadata(self) -> pd.DataFrame:
         """
         Get the metadata of the spatial data.
 
@@ -87,53 +351,25 @@ class GeoDataBase:
         pd.DataFrame
             The metadata of the spatial data.
         """
-        url = f"{URL_METADATA}/{self.geolevel.metadata.value}"
-        params = {"view": "nivelado"}
-        with requests.Session() as session:
-            response = session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-        return pd.DataFrame.from_dict(data)
-
-    @property
-    def metadata(self) -> pd.DataFrame:
+        df = _fetch_metadata(self._metadata_val, self._session)
+        drop, rename = _metadata_rename_spec(self._spatial_val, tuple(df.columns))
+        return df.drop(columns=drop).rename(columns=rename).astype({"id": "int32"})
+
+    @cached_property
+    def polygons_only(self) -> gpd.GeoDataFrame:
         """
-        Get the metadata of the spatial data.
+        Get the polygons of the spatial data without merging the metadata.
 
         Returns
         -------
-        pd.DataFrame
-            The metadata of the spatial data.
+        gpd.GeoDataFrame
+            The ``id`` and ``geometry`` of the polygons.
         """
-        meta = (
-            self._fetch_metadata()
-            .pipe(
-                lambda df: df.drop(
-                    columns=[
-                        x
-                        for x in df.columns
-                        if x.endswith("id") and not x.startswith(self.geolevel.spatial)
-                    ]
-                )
-            )
-            .pipe(
-                lambda df: df.set_axis(
-                    [
-                        (
-                            x.split("-")[-1]
-                            if x.startswith(self.geolevel.spatial)
-                            else x.replace("-nome", "")
-                        )
-                        for x in df.columns
-                    ],
-                    axis=1,
-                )
-            )
-            .astype({"id": int})
-        )
-        return meta
+        return _fetch_polygons(
+            self._spatial_val, self._quality_val, self._session
+        ).copy()
 
-    @property
+    @cached_property
     def polygons(self) -> gpd.GeoDataFrame:
         """
         Get the polygons of the spatial data.
@@ -143,12 +379,19 @@ class GeoDataBase:
         gpd.GeoDataFrame
             The polygons of the spatial data.
         """
-        polygons = self._fetch_polygons()
-        if self.geolevel.spatial == "paises":
+        polygons = self.polygons_only
+        if self._spatial_val == "paises":
             return polygons.set_crs("EPSG:4674")
-        metadata = self.metadata
         crs = polygons.crs if polygons.crs is not None else "EPSG:4674"
-        return gpd.GeoDataFrame(metadata.merge(polygons, on="id")).set_crs(crs)
+        metadata = self.metadata
+        # Align the geometries to the metadata rows by id (ids are unique area
+        # codes), instead of a hash join of the two frames.
+        geometry = polygons.set_index("id").geometry.reindex(metadata["id"])
+        data = metadata.assign(geometry=geometry.array)
+        found = geometry.notna().to_numpy()
+        if not found.all():
+            data = data[found].reset_index(drop=True)
+        return gpd.GeoDataFrame(data, geometry="geometry", crs=crs)
 
     def plot(self, **kwargs) -> None:
         """
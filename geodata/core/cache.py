@@ -0,0 +1,118 @@
+"""
+On-disk cache of IBGE layers for the ibge-geodata package.
+
+Downloaded polygon and metadata layers are stored as (Geo)Parquet files, so later
+processes can skip the network round-trip and the GeoJSON parsing entirely.
+
+Key features
+------------
+- **Configurable location** — files live in ``~/.geodata/cache`` unless the
+  ``GEODATA_CACHE_DIR`` environment variable points elsewhere; setting it to an
+  empty string turns the cache off.
+- **Expiration** — entries older than :data:`CACHE_TTL` seconds (file mtime) are
+  ignored and refreshed on the next download.
+- **Optional** — caching requires ``pyarrow``; without it every read is a miss
+  and every write is a no-op.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+import geopandas as gpd
+import pandas as pd
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL: float = 30 * 24 * 60 * 60
+
+
+def cache_dir() -> Path | None:
+    """
+    Return the directory where cached layers are stored.
+
+    Returns
+    -------
+    Path | None
+        The value of ``GEODATA_CACHE_DIR`` if set, otherwise ``~/.geodata/cache``.
+        None when ``GEODATA_CACHE_DIR`` is set to an empty string, which disables
+        the cache.
+
+    """
+    directory = os.environ.get("GEODATA_CACHE_DIR")
+    if directory is None:
+        return Path.home() / ".geodata" / "cache"
+    return Path(directory) if directory else None
+
+
+def read_cached(name: str, geo: bool = False) -> pd.DataFrame | None:
+    """
+    Read a cached layer if it exists and has not expired.
+
+    Parameters
+    ----------
+    name : str
+        The cache key (file name without extension).
+    geo : bool, optional
+        Whether the entry holds a GeoDataFrame (default: False).
+
+    Returns
+    -------
+    pd.DataFrame | None
+        The cached frame, or None on a miss or when the cache is disabled.
+
+    """
+    directory = cache_dir()
+    if pyarrow is None or directory is None:
+        return None
+    path = directory / f"{name}.parquet"
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_TTL:
+            return None
+        return gpd.read_parquet(path) if geo else pd.read_parquet(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, pyarrow.ArrowException) as e:
+        logger.warning("Ignoring unreadable cache entry '%s': %s", path, e)
+        return None
+
+
+def write_cached(name: str, frame: pd.DataFrame) -> None:
+    """
+    Store a layer in the cache.
+
+    The file is written to a temporary path and atomically moved into place, so
+    concurrent readers never see a partially written entry. Nothing is written
+    when the cache is disabled.
+
+    Parameters
+    ----------
+    name : str
+        The cache key (file name without extension).
+    frame : pd.DataFrame
+        The DataFrame or GeoDataFrame to store.
+
+    """
+    directory = cache_dir()
+    if pyarrow is None or directory is None:
+        return
+    path = directory / f"{name}.parquet"
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        frame.to_parquet(tmp, compression="zstd")
+        os.replace(tmp, path)
+    except (OSError, ValueError, pyarrow.ArrowException) as e:
+        # Caching is best effort: a frame pyarrow cannot serialise must not fail
+        # the download that produced it.
+        logger.warning("Could not write cache entry '%s': %s", path, e)
+        tmp.unlink(missing_ok=True)
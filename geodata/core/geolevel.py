@@ -1,7 +1,9 @@
 from enum import Enum, StrEnum
 
+from geodata.core.mixins import NamedEnumMixin
 
-class SpatialLevel(StrEnum):
+
+class SpatialLevel(NamedEnumMixin, StrEnum):
     """
     SpatialLevel class to represent the spatial level of the data.
 
@@ -28,14 +30,8 @@ class SpatialLevel(StrEnum):
     STATE = "UF"
     MUNICIPALITY = "municipio"
 
-    def __repr__(self) -> str:
-        return f"SpatialLevel.{self.name}"
-
-    def __str__(self) -> str:
-        return self.__repr__()
 
-
-class Metadata(StrEnum):
+class Metadata(NamedEnumMixin, StrEnum):
     """
     Metadata class to represent the metadata level of the data.
 
@@ -62,14 +58,8 @@ class Metadata(StrEnum):
     STATE = "estados"
     MUNICIPALITY = "municipios"
 
-    def __repr__(self) -> str:
-        return f"Metadata.{self.name}"
-
-    def __str__(self) -> str:
-        return self.__repr__()
 
-
-class GeoLevel(Enum):
+class GeoLevel(NamedEnumMixin, Enum):
     """
     GeoLevel class to represent the geographical level of the data.
 
@@ -117,9 +107,3 @@ class GeoLevel(Enum):
     def __init__(self, spatial: SpatialLevel, metadata: Metadata):
         self.spatial = spatial
         self.metadata = metadata
-
-    def __repr__(self):
-        return f"GeoLevel.{self.name}"
-
-    def __str__(self):
-        return self.__repr__()
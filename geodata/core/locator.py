@@ -34,17 +34,90 @@ Typical usage
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+from shapely.geometry import Point
 
 from geodata.core.base import GeoDataBase
 from geodata.core.geolevel import GeoLevel
 from geodata.core.quality import Quality
 from geodata.utils.geocoords import GeoCoords
 
+# Levels queried by the locator, mapped to the GeoLocation attribute they fill.
+_LEVELS: dict[GeoLevel, str] = {
+    GeoLevel.MUNICIPALITY: "municipality",
+    GeoLevel.STATE: "state",
+    GeoLevel.IMMEDIATE_REGION: "immediate_region",
+    GeoLevel.INTERMEDIATE_REGION: "intermediate_region",
+    GeoLevel.REGION: "region",
+}
 
-@dataclass
+
+def _find_polygon(
+    polygons: gpd.GeoDataFrame, coords: GeoCoords, point: Point
+) -> int | None:
+    """
+    Find the position of the first polygon containing a point.
+
+    When the spatial index has been built, it narrows the search down to the
+    polygons whose bounding box contains the point; otherwise every polygon is a
+    candidate. The candidates are then tested with the vectorised
+    :func:`shapely.contains_xy` kernel, which works on the geometry array directly
+    and benefits from geometries prepared with :func:`shapely.prepare`.
+
+    Parameters
+    ----------
+    polygons : gpd.GeoDataFrame
+        The polygons to search.
+    coords : GeoCoords
+        The coordinates to locate.
+    point : Point
+        The same coordinates as a Shapely point, built once by the caller and
+        reused across layers.
+
+    Returns
+    -------
+    int | None
+        The positional index of the containing polygon, or None if not found.
+
+    """
+    geometry = polygons.geometry.values
+    if polygons.has_sindex:
+        candidates = polygons.sindex.query(point)
+        idx = candidates[
+            shapely.contains_xy(geometry[candidates], coords.lon, coords.lat)
+        ]
+    else:
+        idx = np.flatnonzero(shapely.contains_xy(geometry, coords.lon, coords.lat))
+    return int(idx[0]) if len(idx) else None
+
+
+@dataclass(frozen=True, slots=True)
+class _Layer:
+    """
+    A polygon layer prepared for point-in-polygon queries.
+
+    Attributes
+    ----------
+    polygons : gpd.GeoDataFrame
+        The ``id`` and ``geometry`` of the polygons, with a built spatial index and
+        prepared geometries.
+    names : dict[int, str]
+        Mapping from polygon id to the name of the administrative division.
+
+    """
+
+    polygons: gpd.GeoDataFrame
+    names: dict[int, str]
+
+
+@dataclass(slots=True)
 class GeoLocation:
     """
     Data class representing the administrative divisions containing a geographic point.
@@ -102,6 +175,8 @@ class GeoLocator:
     -------
     locate(coords: GeoCoords) -> GeoLocation
         Locate the administrative divisions containing the given geographic coordinates.
+    locate_many(coords: Iterable[GeoCoords]) -> pd.DataFrame
+        Locate the administrative divisions containing each of the given coordinates.
 
     Notes
     -----
@@ -113,6 +188,8 @@ class GeoLocator:
 
     """
 
+    __slots__ = ("quality", "_cache")
+
     def __init__(self, quality: Quality = Quality.LOW) -> None:
         """
         Initialize the GeoLocator with the specified quality level.
@@ -124,40 +201,52 @@ class GeoLocator:
 
         """
         self.quality = quality
-        self._cache: dict[GeoLevel, gpd.GeoDataFrame] = self._load_layers()
+        self._cache: dict[GeoLevel, _Layer] = self._load_layers()
 
-    def _load_layers(self) -> dict[GeoLevel, gpd.GeoDataFrame]:
+    def _load_layers(self) -> dict[GeoLevel, _Layer]:
         """
         Load and cache the necessary polygon layers for point-in-polygon queries.
 
+        The layers are downloaded concurrently, since each one is an independent,
+        network-bound request to the IBGE API.
+
         Returns
         -------
-        dict[GeoLevel, gpd.GeoDataFrame]
-            A dictionary mapping GeoLevel to the corresponding GeoDataFrame.
+        dict[GeoLevel, _Layer]
+            A dictionary mapping GeoLevel to the corresponding layer.
 
         """
-        return {
-            GeoLevel.MUNICIPALITY: GeoDataBase(
-                GeoLevel.MUNICIPALITY,
-                self.quality,
-            ).polygons,
-            GeoLevel.STATE: GeoDataBase(
-                GeoLevel.STATE,
-                self.quality,
-            ).polygons,
-            GeoLevel.IMMEDIATE_REGION: GeoDataBase(
-                GeoLevel.IMMEDIATE_REGION,
-                self.quality,
-            ).polygons,
-            GeoLevel.INTERMEDIATE_REGION: GeoDataBase(
-                GeoLevel.INTERMEDIATE_REGION,
-                self.quality,
-            ).polygons,
-            GeoLevel.REGION: GeoDataBase(
-                GeoLevel.REGION,
-                self.quality,
-            ).polygons,
-        }
+        with ThreadPoolExecutor(max_workers=len(_LEVELS)) as executor:
+            futures = {
+                level: executor.submit(self._load_layer, level) for level in _LEVELS
+            }
+            return {level: future.result() for level, future in futures.items()}
+
+    def _load_layer(self, level: GeoLevel) -> _Layer:
+        """
+        Load a single polygon layer, build its spatial index and prepare its geometries.
+
+        Only the polygon ids and geometries are kept for the spatial query; the
+        names are resolved through a separate id-to-name mapping, which avoids
+        merging the full metadata into the polygons.
+
+        Parameters
+        ----------
+        level : GeoLevel
+            The geographical level of the layer to load.
+
+        Returns
+        -------
+        _Layer
+            The polygons and names of the requested level.
+
+        """
+        geodata = GeoDataBase(level, self.quality)
+        polygons = geodata.polygons_only
+        polygons.sindex  # build the STRtree now rather than on the first query
+        shapely.prepare(polygons.geometry.values)
+        names = geodata.metadata.set_index("id")["nome"].to_dict()
+        return _Layer(polygons=polygons, names=names)
 
     def locate(self, coords: GeoCoords) -> GeoLocation:
         """
@@ -183,10 +272,46 @@ class GeoLocator:
             immediate_region=None,
         )
 
-        for level in GeoLevel:
+        for level, attribute in _LEVELS.items():
             layer = self._cache[level]
-            match = layer[layer.geometry.contains(point)]
-            if not match.empty:
-                geolocation.__setattr__(level.value, match.iloc[0][level.value])
+            position = _find_polygon(layer.polygons, coords, point)
+            if position is not None:
+                polygon_id = int(layer.polygons["id"].iat[position])
+                setattr(geolocation, attribute, layer.names.get(polygon_id))
 
         return geolocation
+
+    def locate_many(self, coords: Iterable[GeoCoords]) -> pd.DataFrame:
+        """
+        Locate the administrative divisions containing each of the given coordinates.
+
+        All points are located with a single spatial join per level, which is much
+        faster than calling :meth:`locate` in a loop for large batches.
+
+        Parameters
+        ----------
+        coords : Iterable[GeoCoords]
+            Geographic coordinates (latitude and longitude) to locate.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per input point, in input order, with the same columns as
+            :meth:`GeoLocation.to_dict`. Levels where a point falls outside all
+            polygons are set to None.
+
+        """
+        coords = list(coords)
+        points = gpd.GeoDataFrame(
+            geometry=gpd.points_from_xy(
+                [c.lon for c in coords], [c.lat for c in coords]
+            ),
+            crs="EPSG:4674",
+        )
+        result = pd.DataFrame(index=points.index)
+        for level, attribute in _LEVELS.items():
+            layer = self._cache[level]
+            joined = gpd.sjoin(points, layer.polygons, how="left", predicate="within")
+            ids = joined["id"][~joined.index.duplicated()]
+            result[attribute] = ids.map(layer.names)
+        return result.astype(object).where(result.notna(), None)
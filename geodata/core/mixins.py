@@ -0,0 +1,27 @@
+"""
+Mixins shared by the enums of the geodata.core package.
+"""
+
+
+class NamedEnumMixin:
+    """
+    Mixin that represents enum members by class and member name.
+
+    Both ``repr`` and ``str`` return ``"<ClassName>.<MEMBER>"`` (e.g.,
+    ``"Quality.HIGH"``), hiding the raw IBGE API value.
+
+    Members can also be looked up by name, case-insensitively, in addition to
+    their value: ``Quality("high") is Quality.HIGH``.
+    """
+
+    @classmethod
+    def _missing_(cls, value: object):
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper().replace("-", "_"))
+        return None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}.{self.name}"
+
+    def __str__(self) -> str:
+        return self.__repr__()
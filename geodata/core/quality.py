@@ -1,7 +1,9 @@
 from enum import StrEnum
 
+from geodata.core.mixins import NamedEnumMixin
 
-class Quality(StrEnum):
+
+class Quality(NamedEnumMixin, StrEnum):
     """
     Quality class to represent the quality of the spatial data.
 
@@ -17,9 +19,3 @@ class Quality(StrEnum):
     LOW = "minima"
     MEDIUM = "intermediaria"
     HIGH = "maxima"
-
-    def __repr__(self) -> str:
-        return f"Quality.{self.name}"
-    
-    def __str__(self) -> str:
-        return self.__repr__()
\ No newline at end of file
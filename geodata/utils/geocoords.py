@@ -15,9 +15,17 @@ Key features
   dict (:meth:`~GeoCoords.to_dict`) for JSON-friendly output.
 - **Geodesic computations** — great-circle distance in km (:meth:`~GeoCoords.distance_to`)
   and initial bearing in degrees (:meth:`~GeoCoords.bearing_to`).
+- **Vectorised distances** — haversine over NumPy arrays in a single pass
+  (:func:`haversine_vector`, :meth:`~GeoCoords.distance_to_many`,
+  :meth:`~GeoCoords.pairwise`).
+- **Optional JIT** — when ``numba`` is installed, the scalar distance and bearing
+  kernels are compiled on first use (Numba is not imported before that);
+  otherwise pure Python is used.
 - **UTM projection** — round-trip conversion to/from any projected CRS supported
   by ``pyproj`` (:meth:`~GeoCoords.to_utm`, :meth:`~GeoCoords.from_utm`),
-  with transformers cached via :func:`functools.lru_cache` to minimise overhead.
+  plus a bulk array path (:meth:`~GeoCoords.transform_points`),
+  with transformers cached per CRS pair (:meth:`~GeoCoords.clear_transformer_cache`
+  releases them) to minimise overhead.
 
 Typical usage
 -------------
@@ -33,21 +41,136 @@ Typical usage
 from __future__ import annotations
 
 import math
+import re
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
-from functools import lru_cache
+from functools import lru_cache, wraps
 
+import numpy as np
+import shapely
+from numpy.typing import ArrayLike
 from pyproj import Transformer
+from pyproj.enums import TransformDirection
 from pyproj.exceptions import CRSError
 from shapely.geometry import Point
 
 _EARTH_RADIUS_KM: float = 6_371.0
+_EPSG_PATTERN = re.compile(r"epsg:\d+", re.IGNORECASE)
+# Hemisphere letters indexed by ``value >= 0``.
+_NS: tuple[str, str] = ("S", "N")
+_EW: tuple[str, str] = ("W", "E")
+# Kernels registered by ``_jit``: name -> (Python function, numba options).
+_KERNELS: dict[str, tuple[Callable, dict]] = {}
+
+
+def _jit(**options):
+    """
+    Compile a kernel with ``numba.njit`` on first use, when Numba is installed.
+
+    Importing Numba is slow, so it is deferred until a kernel is first called
+    instead of happening on ``import geodata``. At that point every decorated
+    kernel is compiled and rebound in this module (see :func:`_compile_kernels`),
+    so later calls go straight to the compiled code. Without Numba the plain
+    Python kernels are rebound instead.
+
+    Parameters
+    ----------
+    **options
+        Keyword arguments forwarded to ``numba.njit``.
+
+    """
+
+    def decorator(func):
+        _KERNELS[func.__name__] = (func, options)
+
+        @wraps(func)
+        def first_call(*args):
+            _compile_kernels()
+            return globals()[func.__name__](*args)
+
+        return first_call
+
+    return decorator
+
+
+def _compile_kernels() -> None:
+    """Replace the lazy kernel stubs by their compiled (or pure-Python) versions."""
+    try:
+        from numba import njit
+    except ImportError:  # pragma: no cover - optional dependency
+        njit = None
+    # Rebind every kernel before any compiles, so that kernels calling each other
+    # resolve to the compiled versions.
+    for name, (func, options) in _KERNELS.items():
+        globals()[name] = func if njit is None else njit(**options)(func)
+
+
+@_jit(cache=True, fastmath=True)
+def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in km between two points given in degrees."""
+    lat1, lon1 = math.radians(lat1), math.radians(lon1)
+    lat2, lon2 = math.radians(lat2), math.radians(lon2)
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    # atan2 form: well conditioned near antipodes, and no domain error if rounding
+    # pushes ``a`` slightly above 1 (a conditional rather than ``max``, which is a
+    # slow call in pure Python).
+    b = 1.0 - a if a < 1.0 else 0.0
+    return 2 * _EARTH_RADIUS_KM * math.atan2(math.sqrt(a), math.sqrt(b))
+
+
+@_jit(cache=True, fastmath=True)
+def _bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Initial bearing in degrees (0–360) between two points given in degrees."""
+    lat1, lat2 = math.radians(lat1), math.radians(lat2)
+    dlon = math.radians(lon2 - lon1)
+    cos_lat2 = math.cos(lat2)
+    x = math.sin(dlon) * cos_lat2
+    y = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * cos_lat2 * math.cos(dlon)
+    return (math.degrees(math.atan2(x, y)) + 360) % 360
+
+
+def _normalize_crs(crs: str) -> str:
+    """
+    Return a canonical cache key for a CRS.
+
+    Only spellings that are exactly equivalent are merged: ``'epsg:32722'`` and
+    ``' EPSG:32722'`` both become ``'EPSG:32722'``. Any other definition (PROJ
+    strings, WKT, ...) is kept as given, so it is never swapped for a merely
+    similar EPSG definition with a different datum.
+
+    Parameters
+    ----------
+    crs : str
+        The coordinate reference system, in any form accepted by ``pyproj``.
+
+    Returns
+    -------
+    str
+        ``'EPSG:<code>'`` for an EPSG authority string, otherwise ``crs``.
+
+    """
+    if isinstance(crs, str) and _EPSG_PATTERN.fullmatch(crs.strip()):
+        return crs.strip().upper()
+    return crs
+
+
+@lru_cache(maxsize=512)
+def _cached_transformer(source_crs: str, target_crs: str) -> Transformer:
+    """Build the Transformer for a pair of normalised CRS keys (cached)."""
+    return Transformer.from_crs(source_crs, target_crs, always_xy=True)
 
 
-@lru_cache(maxsize=32)
 def _get_transformer(source_crs: str, target_crs: str) -> Transformer:
     """
     Return a cached Transformer to avoid repeated initialisation overhead.
 
+    The cache holds up to 512 CRS pairs, enough for the many UTM zones and datums
+    that can be interleaved when working across Brazil, and is keyed by normalised
+    CRS so equivalent spellings share an entry.
+
     Parameters
     ----------
     source_crs : str
@@ -66,7 +189,51 @@ def _get_transformer(source_crs: str, target_crs: str) -> Transformer:
         If either the source or target CRS is invalid.
 
     """
-    return Transformer.from_crs(source_crs, target_crs, always_xy=True)
+    return _cached_transformer(_normalize_crs(source_crs), _normalize_crs(target_crs))
+
+
+def haversine_vector(
+    lat1: ArrayLike, lon1: ArrayLike, lat2: ArrayLike, lon2: ArrayLike
+) -> np.ndarray:
+    """
+    Compute great-circle distances between arrays of points (haversine formula).
+
+    The inputs are broadcast against each other, so one point can be compared with
+    many (or every pair of two sets) in a single vectorised pass. Range checks are
+    done once per array rather than per element.
+
+    Parameters
+    ----------
+    lat1, lon1 : ArrayLike
+        Latitudes and longitudes of the first points, in degrees.
+    lat2, lon2 : ArrayLike
+        Latitudes and longitudes of the second points, in degrees.
+
+    Returns
+    -------
+    np.ndarray
+        Distances in kilometres, with the broadcast shape of the inputs.
+
+    Raises
+    ------
+    ValueError
+        If any latitude is not between -90 and 90 degrees.
+        If any longitude is not between -180 and 180 degrees.
+
+    """
+    lat1, lon1, lat2, lon2 = (
+        np.asarray(x, dtype=np.float64) for x in (lat1, lon1, lat2, lon2)
+    )
+    if np.any(np.abs(lat1) > 90) or np.any(np.abs(lat2) > 90):
+        raise ValueError("Latitudes must be between -90 and 90 degrees.")
+    if np.any(np.abs(lon1) > 180) or np.any(np.abs(lon2) > 180):
+        raise ValueError("Longitudes must be between -180 and 180 degrees.")
+    lat1, lon1, lat2, lon2 = (np.radians(x) for x in (lat1, lon1, lat2, lon2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * _EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(np.maximum(1 - a, 0)))
 
 
 @dataclass(slots=True)
@@ -96,51 +263,60 @@ class GeoCoords:
 
     def __post_init__(self) -> None:
         try:
-            self.lat = float(self.lat)
-            self.lon = float(self.lon)
+            lat = self.lat = float(self.lat)
+            lon = self.lon = float(self.lon)
         except (TypeError, ValueError) as e:
             raise TypeError(
                 f"Latitude and longitude must be numeric. Got: {self.lat!r}, {self.lon!r}"
             ) from e
-        if not (-90 <= self.lat <= 90):
+        # One fused check on the hot path (written with ``<=`` so NaN fails too);
+        # which bound was violated is only worked out when raising.
+        if not ((abs(lat) <= 90) & (abs(lon) <= 180)):
+            if not abs(lat) <= 90:
+                raise ValueError(
+                    f"Latitude must be between -90 and 90 degrees. Got: {lat}"
+                )
             raise ValueError(
-                f"Latitude must be between -90 and 90 degrees. Got: {self.lat}"
-            )
-        if not (-180 <= self.lon <= 180):
-            raise ValueError(
-                f"Longitude must be between -180 and 180 degrees. Got: {self.lon}"
+                f"Longitude must be between -180 and 180 degrees. Got: {lon}"
             )
 
     def __str__(self) -> str:
-        ns = "N" if self.lat >= 0 else "S"
-        ew = "E" if self.lon >= 0 else "W"
-        return f"{abs(self.lat):.6f}°{ns}, {abs(self.lon):.6f}°{ew}"
+        lat, lon = self.lat, self.lon
+        return f"{abs(lat):.6f}°{_NS[lat >= 0]}, {abs(lon):.6f}°{_EW[lon >= 0]}"
 
     @staticmethod
-    def from_tuple(coords: tuple[float, float]) -> GeoCoords:
+    def from_tuple(coords: Sequence[float]) -> GeoCoords:
         """
-        Create a GeoCoords instance from a tuple of (latitude, longitude).
+        Create a GeoCoords instance from a (latitude, longitude) pair.
+
+        Any two-element iterable is accepted: tuples, lists, NumPy array rows, etc.
+        Strings, bytes and mappings are rejected.
 
         Parameters
         ----------
-        coords : tuple[float, float]
-            A tuple containing (latitude, longitude).
+        coords : Sequence[float]
+            A pair containing (latitude, longitude).
 
         Returns
         -------
         GeoCoords
-            An instance of GeoCoords created from the provided tuple.
+            An instance of GeoCoords created from the provided pair.
 
         Raises
         ------
         ValueError
-            If the input is not a tuple of length 2.
+            If the input is not a pair of two values.
             If latitude or longitude values are out of valid ranges.
         """
-        if not isinstance(coords, tuple) or len(coords) != 2:
-            msg = f"Input must be a tuple of (latitude, longitude). Got: {coords!r}"
+        msg = f"Input must be a pair of (latitude, longitude). Got: {coords!r}"
+        # Strings and mappings unpack too (characters / keys), but are not pairs.
+        if isinstance(coords, (str, bytes, Mapping)):
             raise ValueError(msg)
-        return GeoCoords(lat=coords[0], lon=coords[1])
+        try:
+            lat, lon = coords
+        except (TypeError, ValueError) as e:
+            raise ValueError(msg) from e
+        return GeoCoords(lat=lat, lon=lon)
 
     @staticmethod
     def from_dict(data: dict[str, float]) -> GeoCoords:
@@ -170,6 +346,56 @@ class GeoCoords:
             msg = f"Missing required key in coordinate dict: {e}"
             raise KeyError(msg) from e
 
+    @classmethod
+    def from_arrays(cls, lats: ArrayLike, lons: ArrayLike) -> list[GeoCoords]:
+        """
+        Create many GeoCoords instances from arrays of latitudes and longitudes.
+
+        Validation runs once over the whole arrays, so this is considerably faster
+        than calling the constructor in a loop when building large batches of
+        points.
+
+        Parameters
+        ----------
+        lats : ArrayLike
+            Latitudes in degrees.
+        lons : ArrayLike
+            Longitudes in degrees.
+
+        Returns
+        -------
+        list[GeoCoords]
+            One instance per input pair, in input order.
+
+        Raises
+        ------
+        ValueError
+            If the arrays have different shapes.
+            If any latitude is not between -90 and 90 degrees.
+            If any longitude is not between -180 and 180 degrees.
+        """
+        lats = np.asarray(lats, dtype=np.float64).ravel()
+        lons = np.asarray(lons, dtype=np.float64).ravel()
+        if lats.shape != lons.shape:
+            raise ValueError(
+                f"Latitude and longitude arrays differ in length: "
+                f"{lats.size} != {lons.size}"
+            )
+        # Written as ``not <=`` so that NaN is rejected too.
+        if not np.all(np.abs(lats) <= 90):
+            raise ValueError("Latitudes must be between -90 and 90 degrees.")
+        if not np.all(np.abs(lons) <= 180):
+            raise ValueError("Longitudes must be between -180 and 180 degrees.")
+        new = object.__new__
+        instances = []
+        for lat, lon in zip(lats.tolist(), lons.tolist()):
+            # Skip __init__ and __post_init__: the batch is already validated above.
+            instance = new(cls)
+            instance.lat = lat
+            instance.lon = lon
+            instances.append(instance)
+        return instances
+
     def to_tuple(self) -> tuple[float, float]:
         """
         Convert the GeoCoords instance to a tuple of (latitude, longitude).
@@ -206,15 +432,49 @@ class GeoCoords:
         float
             Distance in kilometres.
         """
-        lat1, lon1 = math.radians(self.lat), math.radians(self.lon)
-        lat2, lon2 = math.radians(other.lat), math.radians(other.lon)
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-        )
-        return 2 * _EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+        return _haversine(self.lat, self.lon, other.lat, other.lon)
+
+    def distance_to_many(self, lats: ArrayLike, lons: ArrayLike) -> np.ndarray:
+        """
+        Compute the great-circle distances to many points at once.
+
+        Parameters
+        ----------
+        lats : ArrayLike
+            Latitudes of the target points, in degrees.
+        lons : ArrayLike
+            Longitudes of the target points, in degrees.
+
+        Returns
+        -------
+        np.ndarray
+            Distances in kilometres, one per target point.
+
+        Raises
+        ------
+        ValueError
+            If any target latitude or longitude is out of the valid range.
+        """
+        return haversine_vector(self.lat, self.lon, lats, lons)
+
+    @classmethod
+    def pairwise(cls, coords: Sequence[GeoCoords]) -> np.ndarray:
+        """
+        Compute the great-circle distance between every pair of points.
+
+        Parameters
+        ----------
+        coords : Sequence[GeoCoords]
+            The points to compare.
+
+        Returns
+        -------
+        np.ndarray
+            An ``(N, N)`` symmetric matrix of distances in kilometres.
+        """
+        lats = np.array([c.lat for c in coords], dtype=np.float64)
+        lons = np.array([c.lon for c in coords], dtype=np.float64)
+        return haversine_vector(lats[:, None], lons[:, None], lats, lons)
 
     def bearing_to(self, other: GeoCoords) -> float:
         """
@@ -230,14 +490,7 @@ class GeoCoords:
         float
             Bearing in degrees (0–360), measured clockwise from north.
         """
-        lat1 = math.radians(self.lat)
-        lat2 = math.radians(other.lat)
-        dlon = math.radians(other.lon - self.lon)
-        x = math.sin(dlon) * math.cos(lat2)
-        y = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(
-            lat2
-        ) * math.cos(dlon)
-        return (math.degrees(math.atan2(x, y)) + 360) % 360
+        return _bearing(self.lat, self.lon, other.lat, other.lon)
 
     @staticmethod
     def from_utm(easting: float, northing: float, source_crs: str) -> GeoCoords:
@@ -265,7 +518,12 @@ class GeoCoords:
         """
         try:
             transformer = _get_transformer(source_crs, "EPSG:4326")
-            lon, lat = transformer.transform(easting, northing)
+            lon, lat = transformer.transform(
+                easting,
+                northing,
+                errcheck=False,
+                direction=TransformDirection.FORWARD,
+            )
             return GeoCoords(lat=lat, lon=lon)
         except CRSError as e:
             msg = f"Invalid source CRS '{source_crs}': {e}"
@@ -295,7 +553,12 @@ class GeoCoords:
         """
         try:
             transformer = _get_transformer("EPSG:4326", target_crs)
-            easting, northing = transformer.transform(self.lon, self.lat)
+            easting, northing = transformer.transform(
+                self.lon,
+                self.lat,
+                errcheck=False,
+                direction=TransformDirection.FORWARD,
+            )
             return easting, northing
         except CRSError as e:
             msg = f"Invalid target CRS '{target_crs}': {e}"
@@ -304,10 +567,74 @@ class GeoCoords:
             msg = f"Error transforming geographic coordinates to UTM: {e}"
             raise ValueError(msg) from e
 
+    @staticmethod
+    def transform_points(
+        lats: ArrayLike,
+        lons: ArrayLike,
+        target_crs: str,
+        source_crs: str = "EPSG:4326",
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Project many points between two CRS in a single ``pyproj`` call.
+
+        Prefer this over calling :meth:`to_utm` in a loop: the per-point cost of an
+        array transform is a small fraction of a scalar call.
+
+        Parameters
+        ----------
+        lats : ArrayLike
+            Latitudes (or northings, for a projected ``source_crs``).
+        lons : ArrayLike
+            Longitudes (or eastings, for a projected ``source_crs``).
+        target_crs : str
+            The coordinate reference system to convert to (e.g., ``'EPSG:32722'``).
+        source_crs : str, optional
+            The coordinate reference system of the input (default: ``'EPSG:4326'``).
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The ``(x, y)`` arrays in ``target_crs`` — (easting, northing) for a UTM
+            target, (lon, lat) for a geographic one.
+
+        Raises
+        ------
+        ValueError
+            If either CRS is invalid or the transformation fails.
+        """
+        try:
+            transformer = _get_transformer(source_crs, target_crs)
+            x, y = transformer.transform(
+                np.asarray(lons, dtype=np.float64),
+                np.asarray(lats, dtype=np.float64),
+                errcheck=False,
+                direction=TransformDirection.FORWARD,
+            )
+            return x, y
+        except CRSError as e:
+            msg = f"Invalid CRS '{source_crs}' -> '{target_crs}': {e}"
+            raise ValueError(msg) from e
+        except Exception as e:
+            msg = f"Error transforming coordinates: {e}"
+            raise ValueError(msg) from e
+
+    @staticmethod
+    def clear_transformer_cache() -> None:
+        """
+        Clear the cache of ``pyproj`` transformers used for UTM conversions.
+
+        Each cached transformer holds on to PROJ resources; clearing the cache
+        releases them, e.g. under memory pressure after working with many CRS.
+        """
+        _cached_transformer.cache_clear()
+
     def to_shapely_point(self) -> Point:
         """
         Convert the GeoCoords instance to a Shapely Point object.
 
+        To convert many points, prefer :meth:`to_shapely_points`, which builds them
+        all in one vectorised call.
+
         Returns
         -------
         shapely.geometry.Point
@@ -315,3 +642,26 @@ class GeoCoords:
 
         """
         return Point(self.lon, self.lat)
+
+    @staticmethod
+    def to_shapely_points(lats: ArrayLike, lons: ArrayLike) -> np.ndarray:
+        """
+        Build Shapely Points for arrays of coordinates in a single call.
+
+        Parameters
+        ----------
+        lats : ArrayLike
+            Latitudes in degrees.
+        lons : ArrayLike
+            Longitudes in degrees.
+
+        Returns
+        -------
+        np.ndarray
+            An array of ``shapely.Point`` objects (x = longitude, y = latitude),
+            e.g. for the ``geometry`` of a GeoDataFrame.
+
+        """
+        return shapely.points(
+            np.asarray(lons, dtype=np.float64), np.asarray(lats, dtype=np.float64)
+        )
@@ -15,6 +15,7 @@ from __future__ import annotations
 import math
 from pathlib import Path
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 # ---------------------------------------------------------------------------
@@ -40,15 +41,15 @@ OUT = Path(__file__).parent.parent / "docs/wiki/assets/banner/readme_banner.png"
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
-def vertical_gradient(
-    draw: ImageDraw.ImageDraw, w: int, h: int, top: tuple, bottom: tuple
-) -> None:
-    for y in range(h):
-        t = y / (h - 1)
-        r = int(top[0] + (bottom[0] - top[0]) * t)
-        g = int(top[1] + (bottom[1] - top[1]) * t)
-        b = int(top[2] + (bottom[2] - top[2]) * t)
-        draw.line([(0, y), (w, y)], fill=(r, g, b))
+def vertical_gradient(img: Image.Image, top: tuple, bottom: tuple) -> None:
+    """Fill the image with a top-to-bottom gradient, built as one NumPy array."""
+    w, h = img.size
+    t = np.arange(h) / (h - 1)
+    rgb = np.asarray(top) + (np.asarray(bottom) - np.asarray(top)) * t[:, None]
+    rows = np.empty((h, 4), dtype=np.uint8)
+    rows[:, :3] = rgb.astype(np.uint8)
+    rows[:, 3] = 255
+    img.paste(Image.fromarray(np.repeat(rows[:, None, :], w, axis=1), "RGBA"))
 
 
 def dot_grid(
@@ -61,13 +62,13 @@ def dot_grid(
     r: int = 2,
 ) -> None:
     """Draw a subtle dot grid in the right portion of the banner."""
+    # A few hundred tiny ellipses are cheaper in PIL than compositing a
+    # pre-rendered dot layer over the whole area, so only the loop body is trimmed.
+    fill = (*BORDER, 80)
+    ys = range(y0, y1, gap)
     for gx in range(x0, x1, gap):
-        for gy in range(y0, y1, gap):
-            alpha = 80
-            draw.ellipse(
-                [(gx - r, gy - r), (gx + r, gy + r)],
-                fill=(*BORDER, alpha),
-            )
+        for gy in ys:
+            draw.ellipse((gx - r, gy - r, gx + r, gy + r), fill=fill)
 
 
 def rounded_rect(
@@ -119,7 +120,7 @@ def main() -> None:
     draw = ImageDraw.Draw(img, "RGBA")
 
     # --- gradient background ------------------------------------------------
-    vertical_gradient(draw, W, H, BG_TOP, BG_BOTTOM)
+    vertical_gradient(img, BG_TOP, BG_BOTTOM)
 
     # --- subtle dot grid (right side) ---------------------------------------
     dot_grid(draw, W // 2, 0, W + 40, H, gap=30, r=2)
@@ -197,18 +198,16 @@ def main() -> None:
 
     # --- decorative hexagon grid (right area) --------------------------------
     # light hex outlines
-    def hex_points(cx: int, cy: int, size: int):
-        return [
-            (
-                cx + size * math.cos(math.radians(60 * i - 30)),
-                cy + size * math.sin(math.radians(60 * i - 30)),
-            )
-            for i in range(6)
-        ]
-
-    hex_draw = ImageDraw.Draw(img, "RGBA")
     cols, rows = 7, 5
     hex_size = 68
+    # Vertex offsets of one hexagon, translated to each cell centre below.
+    BASE_HEX = [
+        (
+            (hex_size - 4) * math.cos(math.radians(60 * i - 30)),
+            (hex_size - 4) * math.sin(math.radians(60 * i - 30)),
+        )
+        for i in range(6)
+    ]
     hx_off = int(hex_size * math.sqrt(3))
     hy_off = int(hex_size * 1.5)
     sx = W - (cols * hx_off) - 40
@@ -227,18 +226,18 @@ def main() -> None:
         for row in range(rows):
             cx = sx + col * hx_off + (hx_off // 2 if row % 2 else 0)
             cy = sy + row * hy_off
-            pts = hex_points(cx, cy, hex_size - 4)
+            pts = [(cx + dx, cy + dy) for dx, dy in BASE_HEX]
 
             key = (col, row)
             if key in hex_labels:
-                hex_draw.polygon(pts, fill=(*BLUE, 18), outline=(*BLUE, 60))
+                draw.polygon(pts, fill=(*BLUE, 18), outline=(*BLUE, 60))
                 lbl = hex_labels[key]
                 fw = draw.textlength(lbl, font=font_badge)
                 draw.text(
                     (cx - fw / 2, cy - 9), lbl, font=font_badge, fill=(*BLUE, 160)
                 )
             else:
-                hex_draw.polygon(pts, fill=(*DARK, 5), outline=(*BORDER, 80))
+                draw.polygon(pts, fill=(*DARK, 5), outline=(*BORDER, 80))
 
     # --- save  --------------------------------------------------------------
     OUT.parent.mkdir(parents=True, exist_ok=True)
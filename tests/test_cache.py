@@ -0,0 +1,75 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import geopandas as gpd
+import pandas as pd
+import shapely
+
+from geodata.core import cache
+
+
+@unittest.skipIf(cache.pyarrow is None, "pyarrow is not installed")
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        patcher = mock.patch.dict(os.environ, {"GEODATA_CACHE_DIR": tmp.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_round_trip(self):
+        frame = pd.DataFrame({"id": [1, 2], "nome": ["Norte", "Sul"]})
+        cache.write_cached("regioes_metadata", frame)
+        pd.testing.assert_frame_equal(cache.read_cached("regioes_metadata"), frame)
+
+    def test_round_trip_geo(self):
+        frame = gpd.GeoDataFrame(
+            {"id": [1]}, geometry=[shapely.box(0, 0, 1, 1)], crs="EPSG:4674"
+        )
+        cache.write_cached("regiao_minima", frame)
+        cached = cache.read_cached("regiao_minima", geo=True)
+        self.assertIsInstance(cached, gpd.GeoDataFrame)
+        self.assertEqual(cached.crs, "EPSG:4674")
+        self.assertTrue(cached.geometry.iloc[0].equals(frame.geometry.iloc[0]))
+
+    def test_miss(self):
+        self.assertIsNone(cache.read_cached("missing"))
+
+    def test_expired_entry_is_a_miss(self):
+        cache.write_cached("old", pd.DataFrame({"id": [1]}))
+        path = self.dir / "old.parquet"
+        stale = time.time() - cache.CACHE_TTL - 60
+        os.utime(path, (stale, stale))
+        self.assertIsNone(cache.read_cached("old"))
+
+    def test_corrupt_entry_is_a_miss(self):
+        (self.dir / "corrupt.parquet").write_bytes(b"not a parquet file")
+        with self.assertLogs(cache.logger, "WARNING"):
+            self.assertIsNone(cache.read_cached("corrupt"))
+
+    def test_unserialisable_frame_is_not_cached(self):
+        frame = pd.DataFrame({"a": [1, "x", [1]]})
+        with self.assertLogs(cache.logger, "WARNING"):
+            cache.write_cached("bad", frame)
+        self.assertEqual(list(self.dir.iterdir()), [])
+
+
+    def test_empty_dir_disables_cache(self):
+        frame = pd.DataFrame({"id": [1]})
+        cache.write_cached("regioes_metadata", frame)
+        with mock.patch.dict(os.environ, {"GEODATA_CACHE_DIR": ""}):
+            self.assertIsNone(cache.cache_dir())
+            self.assertIsNone(cache.read_cached("regioes_metadata"))
+            cache.write_cached("estados_metadata", frame)
+        self.assertEqual(
+            [path.name for path in self.dir.iterdir()], ["regioes_metadata.parquet"]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import dataclasses
+import pickle
+import subprocess
+import sys
+import unittest
+
+import numpy as np
+from pyproj import Transformer
+
+from geodata.utils.geocoords import GeoCoords, haversine_vector
+
+
+class TestGeoCoords(unittest.TestCase):
+    def setUp(self):
+        self.brasilia = GeoCoords(lat=-15.7801, lon=-47.9292)
+        self.manaus = GeoCoords(lat=-3.1190, lon=-60.0217)
+        self.sao_paulo = GeoCoords(lat=-23.5505, lon=-46.6333)
+
+    def test_from_tuple_accepts_pairs(self):
+        pair = (-15.7801, -47.9292)
+        for pair in (pair, list(pair), np.array(pair)):
+            self.assertEqual(GeoCoords.from_tuple(pair), self.brasilia)
+        for bad in ((1.0,), (1.0, 2.0, 3.0), 5.0, "12", b"12", {"lat": 1, "lon": 2}):
+            with self.assertRaises(ValueError):
+                GeoCoords.from_tuple(bad)
+
+    def test_fields_are_lat_lon_only(self):
+        self.assertEqual(dataclasses.astuple(self.brasilia), (-15.7801, -47.9292))
+        self.brasilia.distance_to(self.manaus)
+        self.assertEqual(
+            dataclasses.asdict(self.brasilia), {"lat": -15.7801, "lon": -47.9292}
+        )
+        restored = pickle.loads(pickle.dumps(self.brasilia))
+        self.assertEqual(restored, self.brasilia)
+        self.assertEqual(
+            restored.distance_to(self.manaus), self.brasilia.distance_to(self.manaus)
+        )
+
+    def test_str(self):
+        self.assertEqual(str(self.brasilia), "15.780100°S, 47.929200°W")
+        self.assertEqual(str(GeoCoords(lat=0, lon=0)), "0.000000°N, 0.000000°E")
+
+    def test_from_arrays(self):
+        points = [self.brasilia, self.manaus, self.sao_paulo]
+        built = GeoCoords.from_arrays(
+            [c.lat for c in points], [c.lon for c in points]
+        )
+        self.assertEqual(built, points)
+        self.assertEqual(
+            built[0].distance_to(built[1]), points[0].distance_to(points[1])
+        )
+        with self.assertRaises(ValueError):
+            GeoCoords.from_arrays([0, float("nan")], [0, 0])
+
+    def test_distance_to_many_matches_distance_to(self):
+        others = [self.manaus, self.sao_paulo]
+        distances = self.brasilia.distance_to_many(
+            [c.lat for c in others], [c.lon for c in others]
+        )
+        expected = [self.brasilia.distance_to(c) for c in others]
+        np.testing.assert_allclose(distances, expected)
+
+    def test_pairwise(self):
+        matrix = GeoCoords.pairwise([self.brasilia, self.manaus, self.sao_paulo])
+        self.assertEqual(matrix.shape, (3, 3))
+        np.testing.assert_allclose(matrix, matrix.T)
+        np.testing.assert_allclose(np.diag(matrix), 0)
+        self.assertAlmostEqual(
+            matrix[0, 1], self.brasilia.distance_to(self.manaus), places=6
+        )
+
+    def test_utm_round_trip(self):
+        easting, northing = self.brasilia.to_utm("EPSG:32722")
+        back = GeoCoords.from_utm(easting, northing, "EPSG:32722")
+        self.assertAlmostEqual(back.lat, self.brasilia.lat, places=6)
+        self.assertAlmostEqual(back.lon, self.brasilia.lon, places=6)
+
+    def test_utm_proj_string_is_not_replaced_by_similar_epsg(self):
+        crs = "+proj=utm +zone=23 +south +ellps=aust_SA +units=m +no_defs"
+        point = GeoCoords.from_utm(500000, 8250000, crs)
+        expected = Transformer.from_crs(crs, "EPSG:4326", always_xy=True)
+        lon, lat = expected.transform(500000, 8250000)
+        self.assertAlmostEqual(point.lat, lat, places=9)
+        self.assertAlmostEqual(point.lon, lon, places=9)
+        self.assertAlmostEqual(point.lon, -45.0, places=9)
+
+    def test_transform_points_matches_to_utm(self):
+        points = [self.brasilia, self.sao_paulo]
+        eastings, northings = GeoCoords.transform_points(
+            [c.lat for c in points], [c.lon for c in points], "EPSG:32722"
+        )
+        expected = np.array([c.to_utm("EPSG:32722") for c in points])
+        np.testing.assert_allclose(eastings, expected[:, 0])
+        np.testing.assert_allclose(northings, expected[:, 1])
+
+    def test_to_shapely_points(self):
+        points = [self.brasilia, self.manaus]
+        geoms = GeoCoords.to_shapely_points(
+            [c.lat for c in points], [c.lon for c in points]
+        )
+        self.assertEqual(list(geoms), [c.to_shapely_point() for c in points])
+
+    def test_import_does_not_load_numba(self):
+        code = "import sys, geodata; print('numba' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
+    def test_haversine_vector_rejects_out_of_range(self):
+        with self.assertRaises(ValueError):
+            haversine_vector([0, 91], [0, 0], 0, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,19 @@
+import gc
+import json
+import os
+import tempfile
 import unittest
+import weakref
+from unittest import mock
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import requests
+import shapely
+
 from geodata import GeoData, Quality, GeoLevel
+from geodata.core import base
 
 
 class TestGeoData(unittest.TestCase):
@@ -11,7 +25,122 @@ class TestGeoData(unittest.TestCase):
         self.assertEqual(geodata.geolevel.spatial, "regiao")
         self.assertEqual(geodata.quality.value, "maxima")
 
+    def test_lookup_by_name(self):
+        self.assertIs(GeoLevel("region"), GeoLevel.REGION)
+        self.assertIs(GeoLevel("immediate_region"), GeoLevel.IMMEDIATE_REGION)
+        self.assertIs(Quality("high"), Quality.HIGH)
+        self.assertIs(Quality("maxima"), Quality.HIGH)
+        with self.assertRaises(ValueError):
+            Quality("ultra")
+
+    def test_polygons_joins_metadata(self):
+        metadata = pd.DataFrame(
+            {
+                "UF-id": [11, 12, 13],
+                "UF-sigla": ["RO", "AC", "AM"],
+                "UF-nome": ["Rondônia", "Acre", "Amazonas"],
+                "regiao-id": [1, 1, 1],
+                "regiao-nome": ["Norte", "Norte", "Norte"],
+            }
+        )
+        polygons = gpd.GeoDataFrame(
+            {"id": np.array([13, 11], dtype=np.int32)},
+            geometry=[shapely.box(0, 0, 1, 1), shapely.box(1, 1, 2, 2)],
+            crs="EPSG:4674",
+        )
+        with (
+            mock.patch.object(base, "_fetch_metadata", return_value=metadata),
+            mock.patch.object(base, "_fetch_polygons", return_value=polygons),
+        ):
+            geodata = GeoData(GeoLevel.STATE, Quality.LOW)
+            result = geodata.polygons
+            self.assertIs(geodata.polygons, result)
+        self.assertIsInstance(result, gpd.GeoDataFrame)
+        self.assertEqual(result.crs, "EPSG:4674")
+        self.assertEqual(result["id"].tolist(), [11, 13])
+        self.assertEqual(result["nome"].tolist(), ["Rondônia", "Amazonas"])
+        self.assertTrue(result.geometry.iloc[0].equals(shapely.box(1, 1, 2, 2)))
+
+    def test_download_polygons(self):
+        def feature(code, geometry):
+            return {
+                "type": "Feature",
+                "properties": {"codarea": code},
+                "geometry": shapely.geometry.mapping(geometry),
+            }
+
+        country = shapely.MultiPolygon(
+            [shapely.box(0, 0, 1, 1), shapely.box(2, 2, 3, 3)]
+        )
+        states = {"11": shapely.box(0, 0, 1, 1), "12": shapely.box(1, 0, 2, 1)}
+        cases = [
+            ("paises", [feature("BR", country)], [1], [country]),
+            (
+                "UF",
+                [feature(code, box) for code, box in states.items()],
+                [11, 12],
+                list(states.values()),
+            ),
+        ]
+        # Once with the module's decoder (orjson when installed), once with json.
+        for decoder in (base.json, json):
+            for spatial, features, ids, geometries in cases:
+                with self.subTest(decoder=decoder.__name__, spatial=spatial):
+                    session = mock.Mock()
+                    session.get.return_value.content = json.dumps(
+                        {"type": "FeatureCollection", "features": features}
+                    ).encode()
+                    with mock.patch.object(base, "json", decoder):
+                        result = base._download_polygons(spatial, "minima", session)
+                    params = session.get.call_args.kwargs["params"]
+                    self.assertEqual("intrarregiao" in params, spatial != "paises")
+                    self.assertEqual(result.crs, "EPSG:4674")
+                    self.assertEqual(result["id"].dtype, np.int32)
+                    self.assertEqual(result["id"].tolist(), ids)
+                    self.assertTrue(
+                        all(shapely.equals(result.geometry.values, geometries))
+                    )
+
+    def test_layers_are_shared_across_sessions(self):
+        GeoData.clear_cache()
+        self.addCleanup(GeoData.clear_cache)
+        polygons = gpd.GeoDataFrame(
+            {"id": np.array([11], dtype=np.int32)},
+            geometry=[shapely.box(0, 0, 1, 1)],
+            crs="EPSG:4674",
+        )
+        session = requests.Session()
+        session_ref = weakref.ref(session)
+        with (
+            mock.patch.object(base, "read_cached", return_value=None),
+            mock.patch.object(base, "write_cached"),
+            mock.patch.object(
+                base, "_download_polygons", return_value=polygons
+            ) as download,
+        ):
+            GeoData(GeoLevel.STATE, Quality.LOW, session=session).polygons_only
+            GeoData(
+                GeoLevel.STATE, Quality.LOW, session=requests.Session()
+            ).polygons_only
+            self.assertEqual(download.call_count, 1)
+            download.reset_mock()
+        del session
+        gc.collect()
+        self.assertIsNone(session_ref())
+
+    def test_exhausted_retries_return_the_error_response(self):
+        # raise_for_status() must raise requests.HTTPError, not urllib3 RetryError.
+        retry = base._SESSION.get_adapter(base.URL_SPATIAL).max_retries
+        self.assertFalse(retry.raise_on_status)
+        self.assertIn(503, retry.status_forcelist)
+
     def test_geodata_metadata(self):
+        # Keep the downloaded layer out of the developer's ~/.geodata/cache.
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = mock.patch.dict(os.environ, {"GEODATA_CACHE_DIR": tmp.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
         geolevel = GeoLevel.REGION
         quality = Quality.HIGH
         geodata = GeoData(geolevel, quality)
@@ -0,0 +1,106 @@
+import unittest
+from unittest import mock
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+
+from geodata import GeoData, GeoLevel
+from geodata.core import base
+from geodata.core.locator import GeoLocator
+from geodata.utils.geocoords import GeoCoords
+
+# Two municipalities sharing the meridian -45 as a border, inside a single
+# polygon at every other level.
+_MUNICIPALITIES = {
+    1: ("Oeste", shapely.box(-50, -20, -45, -10)),
+    2: ("Leste", shapely.box(-45, -20, -40, -10)),
+}
+_SPATIAL = {level.metadata.value: level.spatial.value for level in GeoLevel}
+
+
+def _layer(spatial: str) -> dict[int, tuple[str, shapely.Geometry]]:
+    if spatial == "municipio":
+        return _MUNICIPALITIES
+    return {10: (f"{spatial} 10", shapely.box(-50, -20, -40, -10))}
+
+
+def _fake_polygons(spatial, quality, session):
+    layer = _layer(spatial)
+    return gpd.GeoDataFrame(
+        {"id": np.array(list(layer), dtype=np.int32)},
+        geometry=[geometry for _, geometry in layer.values()],
+        crs="EPSG:4674",
+    )
+
+
+def _fake_metadata(metadata, session):
+    spatial = _SPATIAL[metadata]
+    layer = _layer(spatial)
+    return pd.DataFrame(
+        {
+            f"{spatial}-id": list(layer),
+            f"{spatial}-nome": [name for name, _ in layer.values()],
+        }
+    )
+
+
+class TestGeoLocator(unittest.TestCase):
+    def setUp(self):
+        GeoData.clear_cache()
+        self.addCleanup(GeoData.clear_cache)
+        with (
+            mock.patch.object(base, "_fetch_polygons", side_effect=_fake_polygons),
+            mock.patch.object(base, "_fetch_metadata", side_effect=_fake_metadata),
+        ):
+            self.locator = GeoLocator()
+
+    def test_locate_hit(self):
+        location = self.locator.locate(GeoCoords(lat=-15.0, lon=-42.5))
+        self.assertEqual(
+            location.to_dict(),
+            {
+                "municipality": "Leste",
+                "state": "UF 10",
+                "immediate_region": "regiao-imediata 10",
+                "intermediate_region": "regiao-intermediaria 10",
+                "region": "regiao 10",
+            },
+        )
+
+    def test_locate_miss(self):
+        location = self.locator.locate(GeoCoords(lat=0.0, lon=0.0))
+        self.assertTrue(all(value is None for value in location.to_dict().values()))
+
+    def test_locate_shared_border(self):
+        # A point on a boundary is not contained by either neighbour.
+        location = self.locator.locate(GeoCoords(lat=-15.0, lon=-45.0))
+        self.assertIsNone(location.municipality)
+        self.assertEqual(location.state, "UF 10")
+
+    def test_locate_many_matches_locate(self):
+        coords = [
+            GeoCoords(lat=-15.0, lon=-47.5),
+            GeoCoords(lat=0.0, lon=0.0),
+            GeoCoords(lat=-15.0, lon=-45.0),
+            GeoCoords(lat=-12.0, lon=-42.5),
+        ]
+        result = self.locator.locate_many(coords)
+        self.assertEqual(result.index.tolist(), list(range(len(coords))))
+        self.assertEqual(
+            result.to_dict("records"),
+            [self.locator.locate(c).to_dict() for c in coords],
+        )
+
+    def test_locate_many_empty(self):
+        result = self.locator.locate_many([])
+        self.assertTrue(result.empty)
+        self.assertEqual(
+            result.columns.tolist(),
+            list(self.locator.locate(GeoCoords(lat=0.0, lon=0.0)).to_dict()),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()